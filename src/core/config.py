@@ -1,6 +1,27 @@
 import json
+import os
+import sys
 from pathlib import Path
-from core.utils import safe_load_json, safe_save_json
+from types import MappingProxyType
+from core.utils import safe_load_json, safe_save_json, read_text_file
+from core.errors import ConfigReadError
+
+# Per-user locations, resolved once at import
+HOME = Path.home()
+
+def _user_data_dir() -> Path:
+    """Return the OS's standard per-user directory for FileSorter's own state."""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or HOME / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or HOME / ".config"
+    return Path(base) / "FileSorter"
+
+APP_DATA_DIR = _user_data_dir()
+RECENT_WORKSPACES_FILE = APP_DATA_DIR / "recent_workspaces.txt"
+# Where older versions kept the list on every OS; read when the new file
+# doesn't exist yet, and the next save writes it to the new location
+_LEGACY_RECENT_WORKSPACES_FILE = HOME / "AppData" / "Local" / "FileSorter" / "recent_workspaces.txt"
 
 # Global variable to store the workspace path
 _workspace_path = None
@@ -30,6 +51,23 @@ def get_user_file():
 # -----------------------------------------------------------
 # 1.  Generate built_in_categories.json if missing
 # -----------------------------------------------------------
+_BUILT_IN_CATEGORIES = {
+    "Images":   ["jpg", "jpeg", "png", "gif", "webp", "bmp", "svg", "ico", "tiff", "tif"],
+    "Videos":   ["mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v", "3gp", "ogv"],
+    "Audio":    ["mp3", "wav", "flac", "aac", "ogg", "wma", "m4a", "opus", "aiff"],
+    "Docs":     ["pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls", "txt", "odt", "odp", "ods", "rtf"],
+    "Executable": ["exe", "msi", "dmg", "app", "deb", "rpm", "apk"],
+    "Archives": ["zip", "rar", "7z", "tar", "gz", "bz2", "xz", "lz", "zst"],
+    "Code":     ["py", "js", "ts", "html", "css", "scss", "cpp", "c", "h", "hpp", "java", "go", "rs", "php", "rb", "swift", "kt", "dart", "json", "xml", "yaml", "yml", "toml"],
+    "Fonts":    ["ttf", "otf", "woff", "woff2", "eot"],
+    "Ebooks":   ["epub", "mobi", "azw3", "djvu"],
+    "Sheets":   ["csv", "tsv"],
+    "Other":    []
+}
+
+# Read-only view so no caller can mutate the shared defaults in place
+BUILT_IN_CATEGORIES = MappingProxyType({cat: tuple(exts) for cat, exts in _BUILT_IN_CATEGORIES.items()})
+
 def _ensure_built_in_file():
     built_in_file = get_built_in_file()
     if built_in_file.exists():
@@ -37,67 +75,119 @@ def _ensure_built_in_file():
     
     # Ensure the config directory exists
     built_in_file.parent.mkdir(parents=True, exist_ok=True)
-    
-    base = {
-        "Images":   ["jpg", "jpeg", "png", "gif", "webp", "bmp", "svg", "ico", "tiff", "tif"],
-        "Videos":   ["mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v", "3gp", "ogv"],
-        "Audio":    ["mp3", "wav", "flac", "aac", "ogg", "wma", "m4a", "opus", "aiff"],
-        "Docs":     ["pdf", "docx", "doc", "pptx", "ppt", "xlsx", "xls", "txt", "odt", "odp", "ods", "rtf"],
-        "Executable": ["exe", "msi", "dmg", "app", "deb", "rpm", "apk"],
-        "Archives": ["zip", "rar", "7z", "tar", "gz", "bz2", "xz", "lz", "zst"],
-        "Code":     ["py", "js", "ts", "html", "css", "scss", "cpp", "c", "h", "hpp", "java", "go", "rs", "php", "rb", "swift", "kt", "dart", "json", "xml", "yaml", "yml", "toml"],
-        "Fonts":    ["ttf", "otf", "woff", "woff2", "eot"],
-        "Ebooks":   ["epub", "mobi", "azw3", "djvu"],
-        "Sheets":   ["csv", "tsv"],
-        "Other":    []
-    }
-    safe_save_json(built_in_file, base)
+    safe_save_json(built_in_file, dict(BUILT_IN_CATEGORIES))
 
 # -----------------------------------------------------------
-# 2.  Public API
+# 2.  Cached loading (re-parse only when a config file changes)
 # -----------------------------------------------------------
-def load_categories():
+_categories_cache = {"key": None, "categories": None, "index": None}
+
+def _file_signature(path: Path):
+    """Return (mtime_ns, size) for a file, or None if it does not exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        raise ConfigReadError(f"Cannot read config file: {e}") from e
+    return (st.st_mtime_ns, st.st_size)
+
+def _check_categories(data, path: Path) -> dict:
+    """Reject a category file that isn't a {name: [extension, ...]} object."""
+    if not isinstance(data, dict) or not all(
+            isinstance(exts, list) and all(isinstance(ext, str) for ext in exts)
+            for exts in data.values()):
+        raise ConfigReadError(f"Cannot read config file: {path} must map category names to lists of extensions")
+    return data
+
+def _normalize_categories(categories: dict) -> dict:
+    """Lowercase hand-edited extensions once at load, stored as tuples."""
+    return {cat: tuple(ext.lower() for ext in exts) for cat, exts in categories.items()}
+
+def _load_cached():
     _ensure_built_in_file()
     built_in_file = get_built_in_file()
     user_file = get_user_file()
-    
-    built_in = safe_load_json(built_in_file)
-    user = safe_load_json(user_file) if user_file.exists() else {}
-    merged = built_in.copy()
-    merged.update(user)
-    return merged
+
+    key = (built_in_file, _file_signature(built_in_file),
+           user_file, _file_signature(user_file))
+    if _categories_cache["key"] != key:
+        built_in = _check_categories(safe_load_json(built_in_file), built_in_file)
+        user = _check_categories(safe_load_json(user_file), user_file) if key[3] is not None else {}
+        merged = _normalize_categories(built_in)
+        merged.update(_normalize_categories(user))
+        _categories_cache.update(key=key, categories=merged,
+                                 index=build_extension_index(merged))
+    return _categories_cache
+
+# -----------------------------------------------------------
+# 3.  Public API
+# -----------------------------------------------------------
+def load_categories():
+    # Hand out copies so callers (e.g. the category editor) can edit freely
+    merged = _load_cached()["categories"]
+    return {cat: list(exts) for cat, exts in merged.items()}
+
+def load_extension_index():
+    """Return the cached extension -> category lookup for the current config."""
+    return _load_cached()["index"]
+
+def build_extension_index(categories: dict) -> dict:
+    """Map each lowercased extension to the first category that lists it."""
+    index = {}
+    for cat, exts in categories.items():
+        for ext in exts:
+            index.setdefault(ext.lower(), cat)
+    return index
 
 def save_user_categories(new_categories: dict):
     user_file = get_user_file()
     # Ensure the config directory exists
     user_file.parent.mkdir(parents=True, exist_ok=True)
     safe_save_json(user_file, new_categories)
+    # Don't rely on mtime granularity to notice our own write
+    _categories_cache["key"] = None
+
+# Recent workspaces, most recent first; read from disk once per session
+_recent_workspaces = None
+
+def load_recent_workspaces():
+    """Return the recently used workspace paths, most recent first."""
+    global _recent_workspaces
+    if _recent_workspaces is None:
+        text = ""
+        for path in (RECENT_WORKSPACES_FILE, _LEGACY_RECENT_WORKSPACES_FILE):
+            try:
+                text = read_text_file(path)
+            except FileNotFoundError:
+                continue
+            except UnicodeDecodeError:
+                # Unreadable in either encoding; start afresh
+                pass
+            break
+        _recent_workspaces = [line for line in text.split("\n") if line]
+    return list(_recent_workspaces)
 
 def save_recent_workspace(workspace_path: Path):
     """Save a workspace path to the recent workspaces list."""
+    global _recent_workspaces
     try:
-        recent_dir = Path.home() / "AppData" / "Local" / "FileSorter"
-        recent_dir.mkdir(parents=True, exist_ok=True)
-        
-        recent_file = recent_dir / "recent_workspaces.txt"
-        
-        # Read existing workspaces
-        existing = []
-        if recent_file.exists():
-            existing = recent_file.read_text().strip().split("\n")
-        
-        # Add current workspace to the top
         workspace_str = str(workspace_path)
+        existing = load_recent_workspaces()
+        if existing[:1] == [workspace_str]:
+            # Already the most recent entry; nothing to write
+            return
+        
+        # Add current workspace to the top, keeping only the 5 most recent
         if workspace_str in existing:
             existing.remove(workspace_str)
         existing.insert(0, workspace_str)
-        
-        # Keep only the 5 most recent
         existing = existing[:5]
         
-        # Write back
-        recent_file.write_text("\n".join(existing))
+        APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        RECENT_WORKSPACES_FILE.write_text("\n".join(existing), encoding="utf-8")
+        _recent_workspaces = existing
     except Exception as e:
         # Just log and continue if we can't save the recent workspace
         import logging
-        logging.getLogger('FileSorter').warning(f"Failed to save recent workspace: {e}")
\ No newline at end of file
+        logging.getLogger('FileSorter').warning(f"Failed to save recent workspace: {e}")
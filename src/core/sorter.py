@@ -1,55 +1,151 @@
+import os
 import shutil
 import sys
+import logging
 from pathlib import Path
 from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from core.config import load_extension_index
 
-# Import tqdm but handle the case where stdout is None (in compiled EXE)
-try:
-    from tqdm import tqdm
-    # Check if stdout is available for tqdm
+# Moves are I/O-bound; a handful of workers is enough to overlap them
+# without thrashing the destination disk
+MAX_MOVE_WORKERS = min(8, os.cpu_count() or 4)
+
+def _iter_files(root):
+    """Yield a DirEntry for every regular file below root."""
+    # scandir reports the entry type from the directory listing itself,
+    # so this avoids the extra stat() per path that rglob + is_file costs
+    stack = [os.fspath(root)]
+    while stack:
+        # A folder that vanished or can't be read has nothing to offer;
+        # skip it rather than abort the whole walk. A missing root is the
+        # same case and yields nothing
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError:
+            continue
+
+def count_files(root) -> int:
+    """Count regular files below root without building Path objects."""
+    # A missing folder counts as empty, which saves callers an exists()
+    # check before every walk. An empty folder is already a single
+    # scandir() call
+    return sum(1 for _ in _iter_files(root))
+
+# Category folders already created this session, so steady-state scans
+# don't issue a mkdir() per category
+_known_dirs = set()
+
+def _ensure_dir(path: str):
+    if path not in _known_dirs:
+        os.makedirs(path, exist_ok=True)
+        _known_dirs.add(path)
+
+# (errno, path) of move failures already logged, so a file that stays
+# locked doesn't add a log line on every scan
+_reported_failures = set()
+
+def _relocate(src: str, dst: str, same_device: bool):
+    if same_device:
+        # A plain rename is one syscall and copies no data; anything it
+        # can't handle (e.g. an existing target on Windows) goes through
+        # shutil.move exactly as before
+        try:
+            os.rename(src, dst)
+            return
+        except OSError:
+            pass
+    shutil.move(src, dst)
+
+def _move_file(src: str, tgt: str, name: str, same_device: bool):
+    dst = os.path.join(tgt, name)
+    try:
+        _relocate(src, dst, same_device)
+    except FileNotFoundError:
+        if os.path.isdir(tgt):
+            raise
+        # The category folder was removed while we were running; recreate it
+        _known_dirs.discard(tgt)
+        _ensure_dir(tgt)
+        _relocate(src, dst, same_device)
+
+def _moves_in_place(jobs):
+    """Move files one after another, yielding (path, error) for each."""
+    for src, tgt, name in jobs:
+        try:
+            _move_file(src, tgt, name, True)
+        except OSError as e:
+            yield src, e
+        else:
+            yield src, None
+
+def _moves_in_pool(jobs):
+    """Copy-move files on worker threads, yielding (path, error) as each finishes."""
+    with ThreadPoolExecutor(max_workers=MAX_MOVE_WORKERS) as pool:
+        futures = {pool.submit(_move_file, src, tgt, name, False): src
+                   for src, tgt, name in jobs}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except OSError as e:
+                yield futures[future], e
+            else:
+                yield futures[future], None
+
+def _progress(iterable, total: int):
+    """Wrap iterable in a tqdm console bar if there is a console and tqdm."""
+    # stdout is None in the compiled EXE; tqdm is only imported when it can draw
     if sys.stdout is None:
-        # Create a dummy tqdm that doesn't output to stdout
-        def tqdm(iterable, desc=None, **kwargs):
-            return iterable
-except ImportError:
-    # Fallback if tqdm is not available
-    def tqdm(iterable, desc=None, **kwargs):
         return iterable
+    try:
+        from tqdm import tqdm
+    except ImportError:
+        return iterable
+    return tqdm(iterable, desc="Sorting", total=total)
 
 def sort_folder(src: Path, dst: Path, progress_cb):
-    from core.config import load_categories
-    categories = load_categories()
+    """Move every file below src into dst's category folders; returns (moved, total)."""
+    ext_index = load_extension_index()
 
-    files = [p for p in src.rglob("*") if p.is_file()]
+    files = list(_iter_files(src))
     plan = defaultdict(list)
 
-    for file in files:
-        ext = file.suffix.lstrip(".").lower()
-        for cat, exts in categories.items():
-            if ext in exts:
-                plan[cat].append(file)
-                break
-        else:
-            plan["Other"].append(file)
+    for entry in files:
+        # rpartition is a single C-level scan; an empty head means either no
+        # dot at all or a dotfile like ".gitignore", which has no extension
+        head, _, ext = entry.name.rpartition(".")
+        plan[ext_index.get(ext.lower() if head else "", "Other")].append(entry)
 
     total = len(files)
-    done = 0
-    with ThreadPoolExecutor() as pool:
-        futures = []
-        for cat, items in plan.items():
-            tgt = dst / cat
-            tgt.mkdir(exist_ok=True)
-            for item in items:
-                futures.append(pool.submit(shutil.move, item, tgt / item.name))
-        
-        # Use tqdm with stdout check, or fallback to simple iteration
-        if sys.stdout is not None:
-            progress_iter = tqdm(futures, desc="Sorting")
+    done = moved = 0
+    same_device = os.stat(src).st_dev == os.stat(dst).st_dev
+    dst_str = os.fspath(dst)
+    jobs = []
+    for cat, items in plan.items():
+        # Build each category's target once; the per-file work is plain strings
+        tgt = os.path.join(dst_str, cat)
+        _ensure_dir(tgt)
+        for item in items:
+            jobs.append((item.path, tgt, item.name))
+
+    # A same-device move is a single rename() syscall, cheaper than the
+    # future and thread hand-off around it; only copies are worth a pool
+    moves = _moves_in_place(jobs) if same_device else _moves_in_pool(jobs)
+
+    for path, error in _progress(moves, total):
+        if error is not None:
+            key = (error.errno, path)
+            if key not in _reported_failures:
+                _reported_failures.add(key)
+                logging.getLogger('FileSorter').error(f"Failed to move {path}: {error}")
         else:
-            progress_iter = futures
-            
-        for _ in progress_iter:
-            done += 1
-            progress_cb(done, total)
+            moved += 1
+        done += 1
+        progress_cb(done, total)
 
+    return moved, total
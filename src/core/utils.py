@@ -1,5 +1,7 @@
 import json
+import locale
 import os
+import re
 import tempfile
 from pathlib import Path
 from core.errors import (
@@ -13,6 +15,28 @@ from core.errors import (
     InvalidExtensionFormat
 )
 
+# mkstemp creates files owner-only; saved configs should get the same
+# umask-based mode a plain open() would give them. Reading the umask
+# means setting it, so do that once at import
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+# orjson parses and serialises several times faster; stdlib json is the fallback
+try:
+    import orjson
+
+    def _loads(data: bytes):
+        return orjson.loads(data)
+
+    def _dumps(data) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+except ImportError:
+    def _loads(data: bytes):
+        return json.loads(data)
+
+    def _dumps(data) -> bytes:
+        return json.dumps(data, indent=2).encode("utf-8")
+
 # ---------- Workspace ----------
 def ensure_workspace(workspace: Path) -> None:
     if not workspace or not workspace.exists():
@@ -23,28 +47,71 @@ def ensure_workspace(workspace: Path) -> None:
 # ---------- Config ----------
 def safe_load_json(path: Path):
     try:
-        return json.loads(path.read_text()) if path.exists() else {}
-    except (json.JSONDecodeError, OSError) as e:
+        # Hand the raw bytes to the parser rather than decoding to str first
+        with path.open("rb") as f:
+            return _loads(f.read())
+    except FileNotFoundError:
+        return {}
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError) as e:
         raise ConfigReadError(f"Cannot read config file: {e}") from e
 
 def safe_save_json(path: Path, data):
     try:
         path.parent.mkdir(parents=True, exist_ok=True)
-        tmp_path = path.with_suffix(".tmp")
-        tmp_path.write_text(json.dumps(data, indent=2))
-        tmp_path.replace(path)
+        payload = _dumps(data)
+        # A uniquely named temp file in the same directory, so concurrent
+        # saves can't clobber each other's half-written file and the final
+        # os.replace stays a same-filesystem atomic rename
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.chmod(tmp_name, 0o666 & ~_UMASK)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
     except OSError as e:
         raise ConfigWriteError(f"Cannot write config file: {e}") from e
 
+def read_text_file(path: Path) -> str:
+    """Read a small text file as UTF-8, upgrading one saved in the locale encoding."""
+    try:
+        return path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        pass
+    # Earlier releases wrote these files in the locale encoding (cp1252 on
+    # Windows); read it that way once and store it as UTF-8 from now on
+    text = path.read_text(encoding=locale.getpreferredencoding(False))
+    try:
+        path.write_text(text, encoding="utf-8")
+    except OSError:
+        pass
+    return text
+
 # ---------- Validation ----------
+_EXT_RE = re.compile(r"[a-z0-9]+")
+
 def validate_extension(ext: str) -> str:
     if not ext or not ext.strip():
         raise EmptyExtension("Extension cannot be empty.")
     ext = ext.lower().lstrip(".")
-    if not ext.isalnum():
+    if not _EXT_RE.fullmatch(ext):
         raise InvalidExtensionFormat("Extensions must be alphanumeric.")
     return ext
 
+_EXT_SEPARATORS_RE = re.compile(r"[,\s]+")
+
+def validate_extension_list(text: str) -> list:
+    """Validate a comma/whitespace separated list of extensions, dropping repeats."""
+    exts = [validate_extension(ext) for ext in _EXT_SEPARATORS_RE.split(text.strip()) if ext]
+    if not exts:
+        raise EmptyExtension("Extension cannot be empty.")
+    return list(dict.fromkeys(exts))
+
 def validate_category_name(name: str) -> str:
     if not name or not name.strip():
         raise EmptyCategoryName("Category name cannot be empty.")
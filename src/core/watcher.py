@@ -1,25 +1,23 @@
-import time
 from pathlib import Path
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
-from core.sorter import sort_folder
-from ui.toast import notify
 
-class DropHandler(FileSystemEventHandler):
-    def __init__(self, drop_dir: Path, sorted_dir: Path):
+class DropChangeHandler(FileSystemEventHandler):
+    """Signals whenever something new appears inside the drop folder."""
+    def __init__(self, on_change):
         super().__init__()
-        self.drop_dir = drop_dir
-        self.sorted_dir = sorted_dir
+        self.on_change = on_change
 
     def on_created(self, event):
-        if event.is_directory:
-            time.sleep(0.3)
-            sort_folder(Path(event.src_path), self.sorted_dir, lambda c, t: None)
-            notify("FileSorter", f"Sorted {Path(event.src_path).name}")
+        self.on_change()
 
-def start_watching(drop_dir: Path, sorted_dir: Path):
-    handler = DropHandler(drop_dir, sorted_dir)
+    def on_moved(self, event):
+        # Browsers download to a temp name and rename it when done
+        self.on_change()
+
+def watch_drop_folder(drop_dir: Path, on_change):
+    handler = DropChangeHandler(on_change)
     obs = Observer()
-    obs.schedule(handler, str(drop_dir), recursive=False)
+    obs.schedule(handler, str(drop_dir), recursive=True)
     obs.start()
     return obs
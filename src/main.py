@@ -1,38 +1,38 @@
 import sys
-import tkinter as tk
-from tkinter import messagebox
+import importlib.util
 from pathlib import Path
 import logging
-import traceback
+import logging.handlers
 import os
-import winshell
-from win32com.client import Dispatch
+import time
 
-# Add the src directory to Python path for imports
-src_path = Path(__file__).parent / "src"
-if str(src_path) not in sys.path:
-    sys.path.insert(0, str(src_path))
+# This file lives in the src directory itself; resolve it once
+_HERE = Path(__file__).resolve().parent
 
-# Import after path setup
-try:
-    from ui.app import FileSorterApp
-    from core.errors import FileSorterError
-    from core.config import set_workspace_path, save_recent_workspace
-except ImportError as e:
-    print(f"Failed to import required modules: {e}")
-    print("Make sure you're running from the project root directory.")
-    sys.exit(1)
+# Make core/ and ui/ importable however we were launched
+if str(_HERE) not in sys.path:
+    sys.path.insert(0, str(_HERE))
 
 
 def setup_logging():
     """Setup logging configuration for the application."""
-    log_dir = Path(__file__).parent / "logs"
+    # Our format never shows thread or process info, so don't collect it per record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
+    log_dir = _HERE / "logs"
     log_dir.mkdir(exist_ok=True)
     
     log_file = log_dir / "filesorter.log"
+    log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
-    # Create handlers list - always include file handler
-    handlers = [logging.FileHandler(log_file, encoding='utf-8')]
+    # Create handlers list - always include file handler. Startup records are
+    # buffered and written in batches until the window is up (see
+    # stop_log_buffering); warnings flush the buffer straight away
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setFormatter(logging.Formatter(log_format))
+    handlers = [logging.handlers.MemoryHandler(100, flushLevel=logging.WARNING, target=file_handler)]
     
     # Only add StreamHandler if stdout is available (not None in compiled EXE)
     if sys.stdout is not None:
@@ -40,7 +40,7 @@ def setup_logging():
     
     logging.basicConfig(
         level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        format=log_format,
         handlers=handlers
     )
     
@@ -51,89 +51,159 @@ def setup_logging():
     return logging.getLogger('FileSorter')
 
 
-def check_dependencies():
-    """Check if all required dependencies are available."""
-    missing_deps = []
+def stop_log_buffering():
+    """Flush the startup log buffer and write to the log file directly from now on."""
+    root_logger = logging.getLogger()
+    for handler in list(root_logger.handlers):
+        if isinstance(handler, logging.handlers.MemoryHandler):
+            handler.flush()
+            root_logger.addHandler(handler.target)
+            root_logger.removeHandler(handler)
+            handler.close()
+
+
+def make_perf_marker(logger, start):
+    """Return mark(step), which logs time since the previous mark if FILESORTER_PERF_LOG=1."""
+    if os.environ.get("FILESORTER_PERF_LOG") != "1":
+        return lambda step: None
     
-    # Check for optional dependencies
-    optional_deps = {
-        'watchdog': 'File system monitoring',
-        'tqdm': 'Progress bars',
-        'plyer': 'System notifications'
-    }
+    perf_logger = logger.getChild("perf")
+    last = start
     
-    for dep, description in optional_deps.items():
-        try:
-            __import__(dep)
-        except ImportError:
-            missing_deps.append(f"  - {dep}: {description}")
+    def mark(step):
+        nonlocal last
+        now = time.perf_counter()
+        perf_logger.info(f"{step}: {now - last:.3f}s")
+        last = now
+    
+    return mark
+
+
+# Optional dependencies and what they add
+OPTIONAL_DEPS = {
+    'watchdog': 'File system monitoring',
+    'tqdm': 'Progress bars',
+    'orjson': 'Faster config loading',
+    'plyer': 'System notifications'
+}
+
+# Which optional packages are installed, probed once. find_spec only locates
+# a package; importing it here would load the whole library just to check
+_HAS = {name: importlib.util.find_spec(name) is not None
+        for name in (*OPTIONAL_DEPS, 'winshell', 'win32com')}
+
+
+def check_dependencies():
+    """Check if all required dependencies are available."""
+    missing_deps = [f"  - {dep}: {description}"
+                    for dep, description in OPTIONAL_DEPS.items() if not _HAS[dep]]
     
     if missing_deps:
         print("Warning: Some optional dependencies are missing:")
         for dep in missing_deps:
             print(dep)
-        print("\nInstall them with: pip install watchdog tqdm plyer")
+        print("\nInstall them with: pip install watchdog tqdm orjson plyer")
         print("The application will still work with reduced functionality.\n")
 
 
-def handle_exception(exc_type, exc_value, exc_traceback):
-    """Global exception handler for unhandled exceptions."""
-    if issubclass(exc_type, KeyboardInterrupt):
-        # Allow Ctrl+C to work normally
-        sys.__excepthook__(exc_type, exc_value, exc_traceback)
-        return
+def show_fatal_dialog(title, message, root=None):
+    """Show an error dialog over root, or over a temporary hidden root if none is given."""
+    import tkinter as tk
+    from tkinter import messagebox
     
-    logger = logging.getLogger('FileSorter')
+    if root is not None:
+        try:
+            root.winfo_exists()
+        except tk.TclError:
+            # Already destroyed; it can't parent a dialog any more
+            root = None
+    owns_root = root is None
+    if owns_root:
+        root = tk.Tk()
+    # A root passed in may be a half-built main window; don't leave it
+    # showing behind the error
+    root.withdraw()
     
-    # Log the exception
-    error_msg = "".join(traceback.format_exception(exc_type, exc_value, exc_traceback))
-    logger.error(f"Unhandled exception: {error_msg}")
+    messagebox.showerror(title, message, parent=root)
     
-    # Show user-friendly error dialog if Tkinter is available
-    try:
-        root = tk.Tk()
-        root.withdraw()  # Hide the root window
+    if owns_root:
+        root.destroy()
+
+
+def make_excepthook(logger, file_sorter_error, get_root=lambda: None):
+    """Build the global handler for unhandled exceptions; get_root() gives the live Tk root, if any."""
+    def handle_exception(exc_type, exc_value, exc_traceback):
+        if issubclass(exc_type, KeyboardInterrupt):
+            # Allow Ctrl+C to work normally
+            sys.__excepthook__(exc_type, exc_value, exc_traceback)
+            return
         
-        if isinstance(exc_value, FileSorterError):
-            # Show user-friendly error for our custom exceptions
-            messagebox.showerror(
-                "FileSorter Error",
-                f"An error occurred:\n\n{str(exc_value)}\n\n"
-                f"Please check the log file for more details."
-            )
-        else:
-            # Show generic error for unexpected exceptions
-            messagebox.showerror(
-                "Unexpected Error",
-                f"An unexpected error occurred:\n\n{exc_type.__name__}: {str(exc_value)}\n\n"
-                f"Please check the log file for more details and consider reporting this bug."
-            )
+        # Log the exception; the handler formats the traceback itself
+        logger.error("Unhandled exception", exc_info=(exc_type, exc_value, exc_traceback))
         
-        root.destroy()
-    except:
-        # If we can't show a dialog, just print to console
-        print(f"\nFatal error: {exc_type.__name__}: {exc_value}")
-        print("Check the log file for more details.")
+        # Show user-friendly error dialog if Tkinter is available
+        try:
+            if isinstance(exc_value, file_sorter_error):
+                # Show user-friendly error for our custom exceptions
+                show_fatal_dialog(
+                    "FileSorter Error",
+                    f"An error occurred:\n\n{str(exc_value)}\n\n"
+                    f"Please check the log file for more details.",
+                    root=get_root()
+                )
+            else:
+                # Show generic error for unexpected exceptions
+                show_fatal_dialog(
+                    "Unexpected Error",
+                    f"An unexpected error occurred:\n\n{exc_type.__name__}: {str(exc_value)}\n\n"
+                    f"Please check the log file for more details and consider reporting this bug.",
+                    root=get_root()
+                )
+        except Exception as e:
+            # If we can't show a dialog, record why and print to console
+            logger.warning(f"Could not show error dialog: {e}")
+            print(f"\nFatal error: {exc_type.__name__}: {exc_value}")
+            print("Check the log file for more details.")
+    
+    return handle_exception
 
 
 def create_desktop_shortcut():
     """Create a desktop shortcut (Windows only for now)."""
+    # Only the packaged EXE gets a shortcut; source runs are development runs
+    if not getattr(sys, "frozen", False):
+        return False
+    
     try:
-        if sys.platform == "win32":
+        if sys.platform == "win32" and _HAS['winshell'] and _HAS['win32com']:
+            from core.config import APP_DATA_DIR
+            
+            # Once the shortcut has been handled, skip pywin32 and COM on later launches
+            marker = APP_DATA_DIR / ".shortcut_created"
+            if marker.exists():
+                return False
+            
+            # pywin32 is slow to load, so only pull it in when it's needed
+            import winshell
+            from win32com.client import Dispatch
             
             desktop = winshell.desktop()
             shortcut_path = Path(desktop) / "FileSorter.lnk"
             
+            created = False
             if not shortcut_path.exists():
                 shell = Dispatch('WScript.Shell')
                 shortcut = shell.CreateShortCut(str(shortcut_path))
+                # In a frozen build the executable is the app itself
                 shortcut.Targetpath = sys.executable
-                shortcut.Arguments = f'"{Path(__file__).absolute()}"'
-                shortcut.WorkingDirectory = str(Path(__file__).parent)
+                shortcut.WorkingDirectory = str(Path(sys.executable).parent)
                 shortcut.IconLocation = sys.executable
                 shortcut.save()
-                
-                return True
+                created = True
+            
+            APP_DATA_DIR.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+            return created
     except ImportError:
         # winshell not available
         pass
@@ -144,45 +214,47 @@ def create_desktop_shortcut():
     return False
 
 
+def iter_workspace_configs():
+    """Yield candidate workspace.txt locations, most likely first."""
+    from core.config import load_recent_workspaces, HOME
+    
+    # Look for workspace config in common locations
+    yield HOME / "Documents" / "FileSorter" / "config" / "workspace.txt"
+    yield _HERE / "workspace.txt"
+    
+    # Only consult the recently used workspaces list if those had nothing
+    try:
+        recent = load_recent_workspaces()
+    except Exception as e:
+        logging.getLogger('FileSorter').warning(f"Failed to read recent workspaces: {e}")
+        return
+    for path_str in recent:
+        yield Path(path_str, "FileSorter", "config", "workspace.txt")
+
+
 def load_previous_workspace():
     """Try to load the previously used workspace."""
     logger = logging.getLogger('FileSorter')
     try:
-        # Look for workspace config in common locations
-        possible_configs = [
-            Path.home() / "Documents" / "FileSorter" / "config" / "workspace.txt",
-            Path(__file__).parent / "workspace.txt",
-        ]
+        from core.config import set_workspace_path, save_recent_workspace
+        from core.utils import read_text_file
         
-        # Try to load from a recently used workspaces list
-        recent_workspaces_file = Path.home() / "AppData" / "Local" / "FileSorter" / "recent_workspaces.txt"
-        if recent_workspaces_file.exists():
+        # Candidates are produced lazily, so we stop at the first usable one
+        for config_file in iter_workspace_configs():
             try:
-                recent_paths = recent_workspaces_file.read_text().strip().split("\n")
-                for path_str in recent_paths:
-                    if path_str:
-                        path = Path(path_str)
-                        # Check if this path has a FileSorter config
-                        config_path = path / "FileSorter" / "config" / "workspace.txt"
-                        if config_path.exists():
-                            possible_configs.append(config_path)
+                workspace_path = Path(read_text_file(config_file).strip())
+                if workspace_path.is_dir():
+                    logger.info(f"Found workspace at: {workspace_path}")
+                    set_workspace_path(workspace_path)
+                    
+                    # Save this workspace to the recent workspaces list
+                    save_recent_workspace(workspace_path)
+                    
+                    return workspace_path
+            except FileNotFoundError:
+                continue
             except Exception as e:
-                logger.warning(f"Failed to read recent workspaces: {e}")
-        
-        for config_file in possible_configs:
-            if config_file.exists():
-                try:
-                    workspace_path = Path(config_file.read_text().strip())
-                    if workspace_path.exists() and workspace_path.is_dir():
-                        logger.info(f"Found workspace at: {workspace_path}")
-                        set_workspace_path(workspace_path)
-                        
-                        # Save this workspace to the recent workspaces list
-                        save_recent_workspace(workspace_path)
-                        
-                        return workspace_path
-                except Exception as e:
-                    logger.warning(f"Failed to load workspace from {config_file}: {e}")
+                logger.warning(f"Failed to load workspace from {config_file}: {e}")
     except Exception as e:
         # If anything goes wrong, just continue without a workspace
         logger.error(f"Error in load_previous_workspace: {e}")
@@ -192,19 +264,40 @@ def load_previous_workspace():
 
 def main():
     """Main entry point for the FileSorter application."""
+    start = time.perf_counter()
+    
     # Setup logging first
     logger = setup_logging()
     logger.info("Starting FileSorter application")
+    mark = make_perf_marker(logger, start)
+    mark("setup_logging")
     
-    # Set up global exception handler
-    sys.excepthook = handle_exception
+    # Set up global exception handler. It reads root when it runs, so it
+    # reuses the main window once that exists
+    root = None
+    from core.errors import FileSorterError
+    sys.excepthook = make_excepthook(logger, FileSorterError, lambda: root)
     
     # Check for dependencies
     check_dependencies()
+    mark("check_dependencies")
+    
+    import tkinter as tk
+    
+    # Import the UI stack only now, so logging is up before it loads
+    try:
+        from ui.app import FileSorterApp
+    except ImportError as e:
+        logger.error(f"Failed to import required modules: {e}")
+        print(f"Failed to import required modules: {e}")
+        print("Make sure you're running from the project root directory.")
+        sys.exit(1)
+    mark("import ui")
     
     try:
         # Create the main Tkinter window
         root = tk.Tk()
+        mark("tk.Tk")
         
         # Set window properties
         root.title("FileSorter - Intelligent File Organization")
@@ -221,38 +314,42 @@ def main():
         previous_workspace = load_previous_workspace()
         if previous_workspace:
             logger.info(f"Loaded previous workspace: {previous_workspace}")
+        mark("load_previous_workspace")
         
         # Create and run the application
         app = FileSorterApp(root)
+        mark("FileSorterApp")
         
         # If we have a previous workspace, set it
         if previous_workspace:
             app.workspace = previous_workspace
             app.set_workspace()
+            mark("set_workspace")
         
         logger.info("Application initialized successfully")
         
         # Try to create desktop shortcut on first run
         if create_desktop_shortcut():
             logger.info("Desktop shortcut created")
+        mark("create_desktop_shortcut")
+        
+        # Once running, records go out as they happen so the log is never stale
+        stop_log_buffering()
         
         # Start the main event loop
         app.run()
         
     except Exception as e:
-        logger.error(f"Failed to start application: {e}")
-        logger.error(traceback.format_exc())
+        logger.error(f"Failed to start application: {e}", exc_info=True)
         
         # Try to show error dialog
         try:
-            root = tk.Tk()
-            root.withdraw()
-            messagebox.showerror(
+            show_fatal_dialog(
                 "Startup Error",
                 f"Failed to start FileSorter:\n\n{str(e)}\n\n"
-                f"Please check the log file for more details."
+                f"Please check the log file for more details.",
+                root=root
             )
-            root.destroy()
         except:
             print(f"Failed to start FileSorter: {e}")
         
@@ -260,16 +357,10 @@ def main():
     
     finally:
         logger.info("FileSorter application terminated")
+        # Write out anything still buffered by the MemoryHandler
+        for handler in logging.getLogger().handlers:
+            handler.flush()
 
 
 if __name__ == "__main__":
-    # Ensure we're running with Python 3.6+
-    if sys.version_info < (3, 6):
-        print("FileSorter requires Python 3.6 or higher.")
-        print(f"You are running Python {sys.version}")
-        sys.exit(1)
-    
-    # Change to the script directory for relative imports
-    os.chdir(Path(__file__).parent)
-    
     main()
\ No newline at end of file
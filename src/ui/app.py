@@ -1,15 +1,46 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
+import math
+import os
 import threading
 import time
+import logging
 
-from core.sorter import sort_folder
+from core.sorter import sort_folder, count_files
 from core.config import load_categories, set_workspace_path, save_recent_workspace
 from core.utils import ensure_workspace
 from core.errors import NoLocationFound
 from ui.category_editor import CategoryEditor
 
+# Without watchdog, scan the drop folder this often
+POLL_INTERVAL_SECONDS = 5
+
+# While watching, still rescan this often in case an event was missed
+SAFETY_RESCAN_SECONDS = 300
+
+# Icon, default text and colour for each StatusIndicator state
+STATUS_STATES = {
+    "idle": {"icon": "⭕", "text": "Ready to sort", "color": "#28a745"},
+    "starting": {"icon": "🔄", "text": "Starting up...", "color": "#ffc107"},
+    "scanning": {"icon": "🔍", "text": "Scanning for files", "color": "#17a2b8"},
+    "sorting": {"icon": "⚡", "text": "Sorting files", "color": "#007bff"},
+    "waiting": {"icon": "⏳", "text": "Waiting for next scan", "color": "#6c757d"},
+    "error": {"icon": "❌", "text": "Error occurred", "color": "#dc3545"}
+}
+
+# Custom ttk styles applied by FileSorterApp.setup_styles
+STYLE_SPECS = (
+    # Button styles - more compact
+    ("Action.TButton", {"font": ("Segoe UI", 10, "bold"), "padding": (12, 8)}),
+    ("Primary.TButton", {"font": ("Segoe UI", 11, "bold"), "padding": (15, 10)}),
+    ("Icon.TButton", {"font": ("Segoe UI Emoji", 12), "padding": (8, 6)}),
+    # Label styles
+    ("Title.TLabel", {"font": ("Segoe UI", 18, "bold")}),
+    ("Subtitle.TLabel", {"font": ("Segoe UI", 11), "foreground": "#000000"}),
+    ("Path.TLabel", {"font": ("Segoe UI", 10, "italic"), "padding": (10, 5)}),
+)
+
 # Store workspace config in FileSorter subfolder
 def get_workspace_config_file(workspace: Path):
     return workspace / "FileSorter" / "config" / "workspace.txt"
@@ -17,48 +48,51 @@ def get_workspace_config_file(workspace: Path):
 
 class AnimatedProgressBar:
     """Custom animated progress indicator"""
-    def __init__(self, parent, width=300, height=6):
-        self.canvas = tk.Canvas(parent, width=width, height=height, 
-                               highlightthickness=0, relief='flat')
-        self.width = width
-        self.height = height
-        self.progress = 0
+    def __init__(self, parent, width=300):
+        # ttk's indeterminate mode animates inside Tk itself, so no Python
+        # callback runs per frame
+        self.value = tk.IntVar(value=0)
+        self.bar = ttk.Progressbar(parent, mode="indeterminate", length=width,
+                                   variable=self.value)
         self.is_animating = False
         
+        # Nobody sees the pulse while the window is minimised, so pause it
+        self._window = self.bar.winfo_toplevel()
+        self._window.bind("<Unmap>", self._on_window_unmap, add="+")
+        self._window.bind("<Map>", self._on_window_map, add="+")
+        
     def pack(self, **kwargs):
-        self.canvas.pack(**kwargs)
+        self.bar.pack(**kwargs)
         
     def start_pulse(self):
         """Start pulsing animation"""
         self.is_animating = True
-        self.pulse_animation()
+        self.bar.configure(mode="indeterminate")
+        self.bar.start(30)
         
     def stop_pulse(self):
         """Stop pulsing animation"""
         self.is_animating = False
-        self.canvas.delete("all")
-        
-    def pulse_animation(self):
-        if not self.is_animating:
-            return
-            
-        self.canvas.delete("all")
-        
-        # Create gradient effect with multiple rectangles
-        for i in range(20):
-            alpha = abs((i - 10)) / 10.0
-            x1 = (self.width / 20) * i
-            x2 = x1 + (self.width / 20)
-            
-            # Color interpolation for gradient effect
-            intensity = int(100 + 155 * (1 - alpha))
-            color = f"#{intensity:02x}{intensity//2:02x}ff"
+        self.bar.stop()
+        self.value.set(0)
+        
+    def set_progress(self, current, total):
+        """Show current out of total as a filled bar."""
+        if self.is_animating:
+            self.is_animating = False
+            self.bar.stop()
+        # Tk repaints the bar itself whenever the variable changes
+        self.bar.configure(mode="determinate", maximum=total)
+        self.value.set(current)
+        
+    def _on_window_unmap(self, event):
+        # Child widgets inherit the toplevel's bindings; only react to the window
+        if event.widget is self._window and self.is_animating:
+            self.bar.stop()
             
-            self.canvas.create_rectangle(x1, 0, x2, self.height, 
-                                       fill=color, outline="")
-        
-        # Schedule next frame
-        self.canvas.after(100, self.pulse_animation)
+    def _on_window_map(self, event):
+        if event.widget is self._window and self.is_animating:
+            self.bar.start(30)
 
 
 class StatusIndicator:
@@ -71,14 +105,9 @@ class StatusIndicator:
         self.icon_label.pack(side="left", padx=(0, 8))
         self.text_label.pack(side="left")
         
-        self.states = {
-            "idle": {"icon": "⭕", "text": "Ready to sort", "color": "#28a745"},
-            "starting": {"icon": "🔄", "text": "Starting up...", "color": "#ffc107"},
-            "scanning": {"icon": "🔍", "text": "Scanning for files", "color": "#17a2b8"},
-            "sorting": {"icon": "⚡", "text": "Sorting files", "color": "#007bff"},
-            "waiting": {"icon": "⏳", "text": "Waiting for next scan", "color": "#6c757d"},
-            "error": {"icon": "❌", "text": "Error occurred", "color": "#dc3545"}
-        }
+        self.states = STATUS_STATES
+        # What the labels currently show, so repeated states skip the redraw
+        self._last = (None, None, None)
     
     def pack(self, **kwargs):
         self.frame.pack(**kwargs)
@@ -86,9 +115,12 @@ class StatusIndicator:
     def set_state(self, state, custom_text=None):
         if state in self.states:
             config = self.states[state]
-            self.icon_label.config(text=config["icon"])
-            self.text_label.config(text=custom_text or config["text"], 
-                                 foreground=config["color"])
+            shown = (config["icon"], custom_text or config["text"], config["color"])
+            if shown == self._last:
+                return
+            self._last = shown
+            self.icon_label.config(text=shown[0])
+            self.text_label.config(text=shown[1], foreground=shown[2])
 
 
 class FileSorterApp:
@@ -105,11 +137,28 @@ class FileSorterApp:
         except:
             pass
 
-        self.workspace = Path()
-        self.drop_dir = Path()
-        self.sort_dir = Path()
+        # None until a workspace is chosen; an empty Path() would mean the
+        # launch directory, which may be the whole home folder
+        self.workspace = None
+        self._workspace_display = ""
+        self.drop_dir = None
+        self.sort_dir = None
         self.sorting = False
-        self.next_scan = 5
+        # Deadlines on the monotonic clock, so a stalled tick doesn't stretch them
+        self._scan_deadline = 0.0
+        self._observer = None
+        self._drop_changed = threading.Event()
+        self._timer_id = None
+        self._last_error = None
+        self._rescan_deadline = 0.0
+        self._next_scan_text = ""
+        self._refresh_pending = False
+        self._progress = (0, 0)
+        self._progress_posted = False
+        self._empty_drop_mtime = None
+        self._sort_thread = None
+        self._drop_count = None
+        self._sort_count = None
 
         # Configure styles
         self.style = ttk.Style()
@@ -120,30 +169,8 @@ class FileSorterApp:
 
     def setup_styles(self):
         """Setup custom styles for modern appearance"""
-        # Configure custom button styles - more compact
-        self.style.configure("Action.TButton",
-                           font=("Segoe UI", 10, "bold"),
-                           padding=(12, 8))
-        
-        self.style.configure("Primary.TButton",
-                           font=("Segoe UI", 11, "bold"),
-                           padding=(15, 10))
-        
-        self.style.configure("Icon.TButton",
-                           font=("Segoe UI Emoji", 12),
-                           padding=(8, 6))
-        
-        # Configure label styles
-        self.style.configure("Title.TLabel",
-                           font=("Segoe UI", 18, "bold"))
-        
-        self.style.configure("Subtitle.TLabel",
-                           font=("Segoe UI", 11),
-                           foreground="#000000")
-        
-        self.style.configure("Path.TLabel",
-                           font=("Segoe UI", 10, "italic"),
-                           padding=(10, 5))
+        for name, options in STYLE_SPECS:
+            self.style.configure(name, **options)
 
     def build_modern_ui(self):
         """Build the modern, immersive UI"""
@@ -288,7 +315,7 @@ class FileSorterApp:
         # Refresh/reload button - DISABLED initially
         self.refresh_btn = ttk.Button(secondary_frame, text="🔄 Refresh",
                                     style="Action.TButton", state="disabled",
-                                    command=self.refresh_categories)
+                                    command=self.refresh)
         self.refresh_btn.grid(row=0, column=1, sticky="ew", padx=(6, 0), pady=6)
         
         # Quick stats display - more compact
@@ -314,10 +341,15 @@ class FileSorterApp:
                  font=("Segoe UI", 8), foreground="#000000").grid(row=0, column=0, sticky="w")
         
         # Help text
-        help_text = "Drag files to Drop folder • Files are automatically sorted every 5 seconds"
+        help_text = "Drag files to Drop folder • Files are sorted automatically as they arrive"
         ttk.Label(footer_frame, text=help_text,
                  font=("Segoe UI", 8), foreground="#000000").grid(row=0, column=1, sticky="e")
 
+    def refresh(self):
+        """Re-read the categories and recount the workspace folders."""
+        self.update_workspace_display(recount=True)
+        self.refresh_categories()
+
     def refresh_categories(self):
         """Refresh category count and related info"""
         try:
@@ -331,31 +363,42 @@ class FileSorterApp:
     def show_temporary_status(self, message, state, duration=2000):
         """Show a temporary status message"""
         self.status_indicator.set_state(state, message)
-        self.root.after(duration, lambda: self.status_indicator.set_state("idle" if not self.sorting else "waiting"))
+        self.root.after(duration, self._restore_status)
 
-    def update_workspace_display(self):
+    def _restore_status(self):
+        """Return the indicator to its resting state once a temporary message expires."""
+        self.status_indicator.set_state("idle" if not self.sorting else "waiting")
+
+    def update_workspace_display(self, recount=False):
         """Update the workspace path display"""
-        if self.workspace.exists():
-            # Truncate long paths for display
-            path_str = str(self.workspace)
-            if len(path_str) > 50:
-                path_str = "..." + path_str[-47:]
-            
-            self.workspace_path.config(text=path_str, foreground="#000000")
+        if self.workspace is not None and self.workspace.exists():
+            self.workspace_path.config(text=self._workspace_display, foreground="#000000")
             self.workspace_icon.config(text="✅")
             self.workspace_btn.config(text="📁 Change Workspace")
             
-            # Update drop and sort folder stats
-            drop_count = len([f for f in self.drop_dir.rglob("*") if f.is_file()]) if self.drop_dir.exists() else 0
-            sort_count = len([f for f in self.sort_dir.rglob("*") if f.is_file()]) if self.sort_dir.exists() else 0
+            # Update drop and sort folder stats. Walking Sorted gets slow as it
+            # grows, so only do it when asked; sorts adjust the cached counts
+            if recount or self._sort_count is None:
+                self._drop_count = count_files(self.drop_dir)
+                self._sort_count = count_files(self.sort_dir)
             
-            self.drop_stats.config(text=f"Drop folder: {drop_count} files pending")
-            self.sort_stats.config(text=f"Sort folder: {sort_count} files organized")
+            self.drop_stats.config(text=f"Drop folder: {self._drop_count} files pending")
+            self.sort_stats.config(text=f"Sort folder: {self._sort_count} files organized")
         else:
             self.workspace_path.config(text="No workspace selected", foreground="#000000")
             self.workspace_icon.config(text="📂")
             self.workspace_btn.config(text="🔍 Select Workspace")
 
+    def schedule_refresh(self):
+        """Redraw the workspace display soon, folding bursts of requests into one."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            self.root.after(100, self._flush_refresh)
+
+    def _flush_refresh(self):
+        self._refresh_pending = False
+        self.update_workspace_display()
+
     # ------------------------------------------------------------------
     # Workspace handling (updated to enable buttons)
     # ------------------------------------------------------------------
@@ -371,13 +414,23 @@ class FileSorterApp:
         self.workspace = Path(ws)
         self.set_workspace()
         
-        # Save workspace config inside the FileSorter subfolder
-        config_file = get_workspace_config_file(self.workspace)
-        config_file.parent.mkdir(parents=True, exist_ok=True)
-        config_file.write_text(str(self.workspace))
+        # Remembering the choice only matters for the next launch, so a slow
+        # or sleeping disk doesn't get to hold up the window
+        threading.Thread(target=self._remember_workspace, args=(self.workspace,),
+                         daemon=True).start()
+
+    def _remember_workspace(self, workspace: Path):
+        """Persist the chosen workspace (runs on a worker thread)."""
+        try:
+            # Save workspace config inside the FileSorter subfolder
+            config_file = get_workspace_config_file(workspace)
+            config_file.parent.mkdir(parents=True, exist_ok=True)
+            config_file.write_text(str(workspace), encoding="utf-8")
+        except OSError as e:
+            logging.getLogger('FileSorter').warning(f"Failed to save workspace config: {e}")
         
         # Also save to recent workspaces list
-        save_recent_workspace(self.workspace)
+        save_recent_workspace(workspace)
 
     def set_workspace(self):
         try:
@@ -386,6 +439,10 @@ class FileSorterApp:
             # Set the workspace path for config system
             set_workspace_path(self.workspace)
             
+            # Truncate long paths for display, once per workspace
+            path_str = str(self.workspace)
+            self._workspace_display = "..." + path_str[-47:] if len(path_str) > 50 else path_str
+            
             # Create directory structure
             self.drop_dir = self.workspace / "Drop"
             self.sort_dir = self.workspace / "Sorted"
@@ -398,13 +455,23 @@ class FileSorterApp:
             self.drop_dir.mkdir(exist_ok=True)
             self.sort_dir.mkdir(exist_ok=True)
             config_dir.mkdir(parents=True, exist_ok=True)
+            
+            # A running watcher still follows the old Drop; move it over,
+            # which also sorts whatever is already waiting in the new one
+            self._empty_drop_mtime = None
+            if self.sorting and self._observer is not None:
+                self._cancel_timer()
+                self.stop_watcher()
+                self.start_watcher()
+                if self._observer is None:
+                    self.timer_loop()
 
             # Enable all buttons now that workspace is set
             self.main_action_btn.config(state="normal")
             self.category_btn.config(state="normal")
             self.refresh_btn.config(state="normal")
             
-            self.update_workspace_display()
+            self.update_workspace_display(recount=True)
             self.refresh_categories()
             self.show_temporary_status("Workspace configured successfully", "scanning")
             
@@ -420,15 +487,11 @@ class FileSorterApp:
     # Sorting callbacks (enhanced with better feedback)
     # ------------------------------------------------------------------
     def sort_done(self, current, total):
-        if current == total and total > 0:
-            self.status_indicator.set_state("waiting", f"Sorted {total} files - waiting for next scan")
-            self.files_processed.config(text=f"Files: {total}")
-            self.progress_bar.stop_pulse()
-            self.update_workspace_display()  # Update file counts
-        elif total > 0:
+        # The finished state is set once by _sort_finished, which also
+        # knows how many files actually moved
+        if total > 0:
             self.status_indicator.set_state("sorting", f"Processing {current}/{total} files")
-            if not self.progress_bar.is_animating:
-                self.progress_bar.start_pulse()
+            self.progress_bar.set_progress(current, total)
 
     # ------------------------------------------------------------------
     # Start / Stop toggle (enhanced)
@@ -445,39 +508,222 @@ class FileSorterApp:
             self.stop_sorting()
 
     def start_sorting(self):
-        if not self.workspace.exists():
+        if self.workspace is None or not self.workspace.exists():
             messagebox.showerror("Error", "No workspace selected.")
             self.sorting = False
             self.main_action_btn.config(text="🚀 Start Sorting")
             return
             
         self.status_indicator.set_state("starting", "Initializing file sorting...")
-        self.timer_loop()
+        self._scan_deadline = time.monotonic() + POLL_INTERVAL_SECONDS
+        self.start_watcher()
+        if self._observer is None:
+            self.timer_loop()
 
     def stop_sorting(self):
         self.sorting = False
+        # Cancel the pending tick so Stop takes effect at once and a quick
+        # restart doesn't leave two timer loops running
+        self._cancel_timer()
+        self.stop_watcher()
         self.progress_bar.stop_pulse()
         self.status_indicator.set_state("idle")
-        self.next_scan_label.config(text="")
+        self.set_next_scan_text("")
+
+    def start_watcher(self):
+        """Watch the drop folder for new files instead of polling it, if possible."""
+        # Imported on first start so watchdog isn't loaded at app startup;
+        # it's optional, and without it we fall back to polling
+        try:
+            from core.watcher import watch_drop_folder
+        except ImportError:
+            return
+        try:
+            # Sort whatever is already waiting, then only when something arrives
+            self._drop_changed.set()
+            self._rescan_deadline = time.monotonic() + SAFETY_RESCAN_SECONDS
+            self._observer = watch_drop_folder(self.drop_dir, self._on_drop_changed)
+            self.set_next_scan_text("Watching for new files")
+        except Exception as e:
+            logging.getLogger('FileSorter').warning(f"Falling back to polling: {e}")
+            self._observer = None
+        else:
+            self._watch_tick()
+
+    def stop_watcher(self):
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def _on_drop_changed(self):
+        # Runs on the observer thread. The flag stays set until a scan
+        # starts, so a burst of events queues only one wake-up
+        if not self._drop_changed.is_set():
+            self._drop_changed.set()
+            self._post(self._watch_tick)
+
+    def _cancel_timer(self):
+        if self._timer_id is not None:
+            self.root.after_cancel(self._timer_id)
+            self._timer_id = None
+
+    def scan_in_progress(self):
+        return self._sort_thread is not None and self._sort_thread.is_alive()
+
+    def scan_drop_folder(self, on_finished=None):
+        """Sort the drop folder on a worker thread so the window stays responsive.
+
+        on_finished(count) runs on the Tk thread afterwards with the number of
+        files found; count is None on error.
+        """
+        if self.scan_in_progress():
+            return
+        self.status_indicator.set_state("scanning", "Scanning drop folder...")
+        # The number of files isn't known until the walk is done; pulse until
+        # the first progress report turns the bar determinate
+        self.progress_bar.start_pulse()
+        self._sort_thread = threading.Thread(target=self._run_sort, args=(on_finished,), daemon=True)
+        self._sort_thread.start()
+
+    def _post(self, callback, *args):
+        """Run callback on the Tk thread; safe to call from the sort thread."""
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            # The window was closed while a sort was still running
+            pass
+
+    def _run_sort(self, on_finished):
+        try:
+            moved, total = sort_folder(self.drop_dir, self.sort_dir, self._report_progress)
+        except Exception as e:
+            self._post(self._sort_failed, e, on_finished)
+        else:
+            self._post(self._sort_finished, moved, total, on_finished)
+
+    def _report_progress(self, current, total):
+        """Progress callback for the sort thread; only the latest value is shown."""
+        # A sort reports once per file, far faster than the window can
+        # redraw, so keep one flush queued and let it pick up the newest
+        self._progress = (current, total)
+        if not self._progress_posted:
+            self._progress_posted = True
+            self._post(self._flush_progress)
+
+    def _flush_progress(self):
+        # Clear the flag before reading, so a report that lands meanwhile
+        # queues another flush instead of being lost
+        self._progress_posted = False
+        # A sort still running after Stop finishes quietly
+        if self.sorting:
+            self.sort_done(*self._progress)
+
+    def _sort_finished(self, moved, total, on_finished):
+        # The thread may not have exited yet; it is done with its work
+        self._sort_thread = None
+        self._last_error = None
+        self.progress_bar.stop_pulse()
+        if total > 0:
+            # After Stop the status stays idle; only the counts change
+            if self.sorting:
+                self.status_indicator.set_state("waiting", f"Sorted {moved} files - waiting for next scan")
+                self.files_processed.config(text=f"Files: {moved}")
+            # Drop is all but empty after a sort, so recounting it is cheap;
+            # Sorted only grew by the files that actually moved
+            self._drop_count = count_files(self.drop_dir)
+            if self._sort_count is not None:
+                self._sort_count += moved
+            self.schedule_refresh()  # Update file counts
+        if moved < total and self._observer is not None:
+            # A file still being written fails to move and raises no new
+            # event once it is closed, so retry soon instead of waiting
+            # for the safety rescan
+            self._rescan_deadline = min(self._rescan_deadline, time.monotonic() + POLL_INTERVAL_SECONDS)
+        if on_finished is not None:
+            on_finished(total)
+
+    def _sort_failed(self, error, on_finished):
+        self._sort_thread = None
+        self.progress_bar.stop_pulse()
+        # A modal dialog blocks the scan loop, so only pop one up when
+        # the error changes; repeats just go to the status bar
+        if str(error) != self._last_error:
+            self._last_error = str(error)
+            logging.getLogger('FileSorter').error(f"Sorting failed: {error}")
+            messagebox.showerror("Error", str(error))
+        self.show_temporary_status("Sorting failed", "error")
+        if on_finished is not None:
+            on_finished(None)
+
+    def poll_drop_folder(self):
+        """Polling-mode scan that skips the walk while Drop stays empty."""
+        try:
+            mtime = os.stat(self.drop_dir).st_mtime_ns
+        except OSError:
+            mtime = None
+        # Adding anything to an empty folder bumps its mtime, so an unchanged
+        # mtime means it is still empty and there is nothing to list
+        if mtime is not None and mtime == self._empty_drop_mtime:
+            return
+        self._empty_drop_mtime = None
+        self.scan_drop_folder(lambda count: self._remember_empty_drop(count, mtime))
+
+    def _remember_empty_drop(self, count, mtime):
+        if count != 0:
+            return
+        # Subfolders left behind can gain files without touching Drop's
+        # own mtime, so only trust the shortcut for a truly empty folder
+        try:
+            with os.scandir(self.drop_dir) as it:
+                if next(it, None) is None:
+                    self._empty_drop_mtime = mtime
+        except OSError:
+            pass
+
+    def _watch_scan_finished(self, count):
+        if count == 0 and self.sorting:
+            self.status_indicator.set_state("waiting", "Watching drop folder")
+        # Pick up changes that arrived mid-scan and re-arm the rescan
+        self._watch_tick()
+
+    def _watch_tick(self):
+        """Watch-mode scheduler: scan on a change, or when the safety rescan is due."""
+        # Nothing ticks in between; the observer posts a call here when
+        # something arrives, and one after() covers the safety rescan
+        if not self.sorting or self._observer is None or self.scan_in_progress():
+            # A running scan calls back here when it finishes
+            return
+        now = time.monotonic()
+        if self._drop_changed.is_set() or now >= self._rescan_deadline:
+            self._drop_changed.clear()
+            self._rescan_deadline = now + SAFETY_RESCAN_SECONDS
+            self.scan_drop_folder(self._watch_scan_finished)
+            return
+        self._cancel_timer()
+        self._timer_id = self.root.after(math.ceil((self._rescan_deadline - now) * 1000), self._watch_tick)
+
+    def set_next_scan_text(self, text):
+        """Update the next-scan label, skipping the redraw if it already says that."""
+        if text != self._next_scan_text:
+            self._next_scan_text = text
+            self.next_scan_label.config(text=text)
 
     def timer_loop(self):
+        """Polling-mode tick, once a second to drive the countdown label."""
+        self._timer_id = None
         if not self.sorting:
             return
+
+        remaining = math.ceil(self._scan_deadline - time.monotonic())
+        if remaining <= 0:
+            self.poll_drop_folder()
+            self._scan_deadline = time.monotonic() + POLL_INTERVAL_SECONDS
+        elif not self.scan_in_progress():
+            # A running sort owns the status bar until it finishes
+            self.status_indicator.set_state("waiting", f"Next scan in {remaining}s")
+            self.set_next_scan_text(f"Next scan: {remaining}s")
             
-        if self.next_scan <= 0:
-            try:
-                self.status_indicator.set_state("scanning", "Scanning drop folder...")
-                sort_folder(self.drop_dir, self.sort_dir, self.sort_done)
-            except Exception as e:
-                messagebox.showerror("Error", str(e))
-                self.show_temporary_status("Sorting failed", "error")
-            self.next_scan = 5
-        else:
-            self.next_scan -= 1
-            self.status_indicator.set_state("waiting", f"Next scan in {self.next_scan}s")
-            self.next_scan_label.config(text=f"Next scan: {self.next_scan}s")
-            
-        self.root.after(1000, self.timer_loop)
+        self._timer_id = self.root.after(1000, self.timer_loop)
 
     def run(self):
         self.root.mainloop()
\ No newline at end of file
@@ -2,9 +2,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from pathlib import Path
 import json
+import threading
 
-from core.config import load_categories, save_user_categories
-from core.utils import validate_extension, validate_category_name
+from core.config import load_categories, save_user_categories, BUILT_IN_CATEGORIES
+from core.utils import validate_extension_list, validate_category_name
 from core.errors import (
     EmptyExtension,
     DuplicateExtension,
@@ -14,6 +15,42 @@ from core.errors import (
 )
 
 
+# Text shown by CategoryEditor.show_help
+HELP_CONTENT = """
+🗂️ Category Manager
+
+The Category Manager allows you to organize file extensions into categories for automatic file sorting.
+
+📌 Basic Operations:
+• Create new categories to group related file types
+• Add extensions to categories (separate several with commas or spaces)
+• Delete extensions or categories
+• Search for categories or extensions
+
+📌 Keyboard Shortcuts:
+• Ctrl+N: Create a new category
+• Ctrl+E: Add an extension to selected category
+• Ctrl+F: Search for categories or extensions
+• F1: Show this help
+• Delete: Delete selected item
+
+📌 Tips:
+• Right-click on categories or extensions for additional options
+• Double-click on a category to expand or collapse it
+• Use the search bar to quickly find categories or extensions
+• The "Other" category cannot be deleted as it's used for uncategorized files
+• Changes are only saved when you click "Save & Close"
+
+📌 Categories:
+Categories help organize your files by type. Each category can contain multiple file extensions.
+Built-in categories include: Images, Videos, Audio, Docs, Executable, Archives, Code, Fonts, Ebooks, Sheets, and Other.
+
+📌 Extensions:
+Extensions are file types (without the dot). For example: "pdf", "jpg", "mp3".
+Each extension can only belong to one category.
+"""
+
+
 class ModernDialog(tk.Toplevel):
     """Custom dialog for adding categories and extensions with modern styling."""
     
@@ -23,14 +60,12 @@ class ModernDialog(tk.Toplevel):
         self.validate_func = validate_func
         
         self.title(title)
-        self.geometry("400x200")
+        # Size and position the dialog in one window-manager request
+        self.geometry("400x200+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
         self.resizable(False, False)
         self.transient(parent)
         self.grab_set()
         
-        # Center the dialog
-        self.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
-        
         self.create_widgets(prompt)
         self.entry.focus_set()
         
@@ -82,23 +117,38 @@ class CategoryEditor(tk.Toplevel):
     def __init__(self, parent):
         super().__init__(parent)
         self.title("Category Manager - FileSorter")
-        self.geometry("830x630")  # Increased window size by 30 pixels
+        # Window size increased by 30 pixels; size and position set together
+        self.geometry("830x630+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
         self.resizable(True, True)
         self.transient(parent)
         self.grab_set()
         self.minsize(780, 580)  # Increased minimum size by 30 pixels
         
-        # Center the window
-        self.geometry("+%d+%d" % (parent.winfo_rootx() + 50, parent.winfo_rooty() + 50))
-        
         # Set up custom styles
         self.setup_styles()
         
+        # Tooltip text by widget path; one shared window shows them all
+        self._tooltips = {}
+        self._tooltip_win = None
+        self.bind("<Enter>", self.show_tooltip, add="+")
+        self.bind("<Leave>", self.hide_tooltip, add="+")
+        
         self.categories = load_categories()
+        # Set by every edit, so closing an unchanged editor writes nothing
+        self._dirty = False
+        # Tree bookkeeping, filled in by refresh_tree
+        self._tree_index = {}
+        self._ext_iids = {}
+        self._user_open = set()
+        self._auto_expanded = set()
+        self._status_after_id = None
+        self._saving = False
         
         # Initialize search variables
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self.on_search_change)
+        self._search_after_id = None
+        # The search text the tree is currently filtered by
+        self._applied_search = ""
         
         self.build_ui()
         self.refresh_tree()
@@ -299,6 +349,8 @@ class CategoryEditor(tk.Toplevel):
         self.search_entry = ttk.Entry(search_frame, textvariable=self.search_var,
                                      font=("Segoe UI", 11))
         self.search_entry.grid(row=0, column=1, sticky="ew", ipady=3)
+        # Only typing filters; programmatic changes apply the search themselves
+        self.search_entry.bind("<KeyRelease>", self.on_search_change)
         
         # Clear search button
         clear_btn = ttk.Button(search_frame, text="✕", width=3,
@@ -357,24 +409,46 @@ class CategoryEditor(tk.Toplevel):
         # Store reference for updating
         self.category_buttons_frame = scrollable_frame
         self.category_canvas = canvas
+        # Category name -> (button, label text) for the buttons on show
+        self._category_buttons = {}
         
         # Initial population of category buttons
         self.update_category_buttons()
 
-    def update_category_buttons(self):
-        """Update the category buttons in the quick access section."""
-        # Clear existing buttons
-        for widget in self.category_buttons_frame.winfo_children():
-            widget.destroy()
-        
-        # Add category buttons
-        for i, (cat, exts) in enumerate(sorted(self.categories.items())):
-            btn = ttk.Button(self.category_buttons_frame,
-                           text=f"📁 {cat} ({len(exts)})",
-                           command=lambda c=cat: self.select_category_in_tree(c),
-                           width=15)
-            btn.pack(side="left", padx=2, pady=2)
-            self.create_tooltip(btn, f"Click to select {cat} category in tree")
+    def update_category_buttons(self, sorted_categories=None):
+        """Update the category buttons in the quick access section.
+
+        sorted_categories, if given, is sorted(self.categories.items()).
+        """
+        if sorted_categories is None:
+            sorted_categories = sorted(self.categories.items())
+
+        # Only touch the buttons that changed, rather than rebuilding them all
+        buttons = self._category_buttons
+        for cat in [cat for cat in buttons if cat not in self.categories]:
+            btn = buttons.pop(cat)[0]
+            self._tooltips.pop(str(btn), None)
+            btn.destroy()
+        
+        # Walk backwards so a new button can be packed before its successor
+        following = None
+        for cat, exts in reversed(sorted_categories):
+            text = f"📁 {cat} ({len(exts)})"
+            if cat not in buttons:
+                btn = ttk.Button(self.category_buttons_frame,
+                               text=text,
+                               command=lambda c=cat: self.select_category_in_tree(c),
+                               width=15)
+                if following is None:
+                    btn.pack(side="left", padx=2, pady=2)
+                else:
+                    btn.pack(side="left", padx=2, pady=2, before=following)
+                self.create_tooltip(btn, f"Click to select {cat} category in tree")
+                buttons[cat] = (btn, text)
+            elif buttons[cat][1] != text:
+                buttons[cat][0].config(text=text)
+                buttons[cat] = (buttons[cat][0], text)
+            following = buttons[cat][0]
         
         # Update canvas scroll region
         self.category_buttons_frame.update_idletasks()
@@ -382,13 +456,12 @@ class CategoryEditor(tk.Toplevel):
 
     def select_category_in_tree(self, category_name):
         """Select a category in the tree view."""
-        for item in self.tree.get_children():
-            item_text = self.tree.item(item, "text")
-            if item_text == f"📁 {category_name}":
-                self.tree.selection_set(item)
-                self.tree.focus(item)
-                self.tree.see(item)
-                break
+        item = f"cat::{category_name}"
+        # Categories hidden by the current search aren't among the root's children
+        if item in self.tree.get_children():
+            self.tree.selection_set(item)
+            self.tree.focus(item)
+            self.tree.see(item)
 
     def create_tree_section(self, parent):
         """Create the main tree view section."""
@@ -428,7 +501,12 @@ class CategoryEditor(tk.Toplevel):
         v_scroll.grid(row=0, column=1, sticky="ns")
         h_scroll.grid(row=1, column=0, sticky="ew")
         
+        # Row styles, configured once; rows only switch tags
+        self.tree.tag_configure("category", font=("Segoe UI", 9, "bold"))
+        self.tree.tag_configure("matched", background="#fff59d")
+        
         # Bind events
+        self.tree.bind("<<TreeviewOpen>>", self.on_tree_open)
         self.tree.bind("<Double-1>", self.on_tree_double_click)
         self.tree.bind("<Button-3>", self.on_tree_right_click)
         self.tree.bind("<Return>", lambda e: self.on_tree_enter_key())
@@ -527,12 +605,10 @@ class CategoryEditor(tk.Toplevel):
     def update_stats(self):
         """Update the statistics display."""
         total_categories = len(self.categories)
-        total_extensions = sum(len(exts) for exts in self.categories.values())
+        total_extensions = sum(map(len, self.categories.values()))
         
-        # Count custom categories (assuming built-in ones are standard)
-        built_in_cats = {"Images", "Videos", "Audio", "Docs", "Executable", 
-                        "Archives", "Code", "Fonts", "Ebooks", "Sheets", "Other"}
-        custom_categories = sum(1 for cat in self.categories.keys() if cat not in built_in_cats)
+        # Count custom categories against the single built-in definition in config
+        custom_categories = len(self.categories.keys() - BUILT_IN_CATEGORIES.keys())
         
         self.stats_categories.config(text=f"Categories: {total_categories}")
         self.stats_extensions.config(text=f"Extensions: {total_extensions}")
@@ -540,33 +616,199 @@ class CategoryEditor(tk.Toplevel):
 
     def refresh_tree(self):
         """Refresh the tree view with current categories."""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-        
-        # Add categories
-        for cat, exts in sorted(self.categories.items()):
-            # Format extensions list
-            ext_display = ", ".join(f".{ext}" for ext in sorted(exts))
-            if len(ext_display) > 50:
-                ext_display = ext_display[:47] + "..."
+        # Clear existing items. Rows hidden by a search are detached, so
+        # they aren't among the children; delete them by id as well
+        for ext_iids in self._ext_iids.values():
+            self.tree.delete(*ext_iids)
+        self.tree.delete(*self._tree_index)
+        
+        # Add categories, remembering each item so searches can hide and
+        # show them rather than rebuild the tree. Maps category iid to its
+        # lowercased name and [(extension, lowercased extension), ...]
+        self._tree_index = {}
+        # Category iid -> its extension row iids, for categories whose rows
+        # have been created; the rest hold a single placeholder child
+        self._ext_iids = {}
+        # Item id -> the category or extension it shows, so handlers don't
+        # have to parse names back out of the display text
+        self._item_names = {}
+        # Extension rows currently highlighted as search matches
+        self._matched_exts = set()
+        # The last search and the category iids it left visible
+        self._last_search = ("", None)
+        # Categories the user expanded, and those a search expanded for them,
+        # so filtering can restore the user's own choices
+        self._user_open = set()
+        self._auto_expanded = set()
+        sorted_categories = sorted(self.categories.items())
+        for cat, exts in sorted_categories:
+            exts = sorted(exts)
             
             # Insert category
-            parent = self.tree.insert("", "end", text=f"📁 {cat}", 
-                                    values=(len(exts), ext_display))
+            parent = self.tree.insert("", "end", iid=f"cat::{cat}", text=f"📁 {cat}",
+                                    values=(len(exts), self.format_extensions(exts)),
+                                    tags=("category",))
+            
+            # Extension rows are only created once the category is opened or
+            # searched into; a placeholder child gives it an expand arrow
+            if exts:
+                self.tree.insert(parent, "end", values=("", ""))
             
-            # Add individual extensions as children
-            for ext in sorted(exts):
-                self.tree.insert(parent, "end", text=f"🏷️ .{ext}", values=("", ""))
+            # Names are lowercased here once, not on every search
+            self._tree_index[parent] = (cat.lower(), [(ext, ext.lower()) for ext in exts])
+            self._item_names[parent] = cat
+        
+        # Keep an active search applied to the rebuilt tree
+        search_text = self.search_var.get().lower()
+        if search_text:
+            self.filter_tree(search_text)
         
         self.update_stats()
-        self.update_category_buttons()
+        self.update_category_buttons(sorted_categories)
         self.set_status("Tree refreshed")
 
+    @staticmethod
+    def format_extensions(exts):
+        """Format extensions for the tree's Extensions column."""
+        # Only the first 50 characters are ever shown, so stop collecting
+        # extensions once the joined text would be longer than that
+        parts = []
+        length = -2  # No ", " before the first one
+        for ext in exts:
+            parts.append(f".{ext}")
+            length += len(ext) + 3
+            if length > 50:
+                break
+        ext_display = ", ".join(parts)
+        if len(ext_display) > 50:
+            ext_display = ext_display[:47] + "..."
+        return ext_display
+
+    def populate_category(self, cat_iid):
+        """Create a category's extension rows if they don't exist yet."""
+        if cat_iid in self._ext_iids or cat_iid not in self._tree_index:
+            return
+        self.tree.delete(*self.tree.get_children(cat_iid))
+        
+        # Add individual extensions as children
+        exts = [ext for ext, _ in self._tree_index[cat_iid][1]]
+        ext_iids = [self.tree.insert(cat_iid, "end", text=f"🏷️ .{ext}", values=("", ""))
+                    for ext in exts]
+        self._item_names.update(zip(ext_iids, exts))
+        self._ext_iids[cat_iid] = ext_iids
+
+    def on_tree_open(self, event):
+        """Fill in a category's extensions as it is expanded."""
+        self.populate_category(self.tree.focus())
+
+    def filter_tree(self, search_text):
+        """Show only categories and extensions containing search_text."""
+        # Items are detached and reattached in place; an empty search matches
+        # everything and so restores the full tree
+        # Typing more of the same query can only narrow the results, so
+        # only the categories still visible need checking
+        previous, visible = self._last_search
+        if previous and visible is not None and search_text.startswith(previous):
+            candidates = visible
+        else:
+            candidates = self._tree_index
+        
+        # Note which of the shown categories the user has open; ones the
+        # last search expanded don't count. Hidden ones keep their last state
+        for cat_iid in self._tree_index if visible is None else visible:
+            if cat_iid in self._auto_expanded:
+                continue
+            if self.tree.item(cat_iid, "open"):
+                self._user_open.add(cat_iid)
+            else:
+                self._user_open.discard(cat_iid)
+        
+        position = 0
+        expand = []
+        matched_exts = set()
+        now_visible = []
+        shown_exts = set()
+        for cat_iid in candidates:
+            cat_lower, children = self._tree_index[cat_iid]
+            cat_matches = search_text in cat_lower
+            matching_exts = [ext for ext, ext_lower in children if search_text in ext_lower]
+            
+            if not (cat_matches or matching_exts):
+                self.tree.detach(cat_iid)
+                continue
+            
+            # Show matching extensions, or all of them if only the name matched.
+            # Collapse while rearranging so Tk doesn't lay out rows that
+            # are about to change
+            shown = matching_exts or [ext for ext, _ in children]
+            self.tree.item(cat_iid, values=(len(shown), self.format_extensions(shown)),
+                           open=False,
+                           tags=("category", "matched") if search_text and cat_matches else ("category",))
+            self.tree.reattach(cat_iid, "", position)
+            position += 1
+            now_visible.append(cat_iid)
+            if matching_exts and not cat_matches:
+                expand.append(cat_iid)
+            
+            # Matching extension rows are needed now, as are the rows of a
+            # category about to be reopened; any other category shown with
+            # all of its extensions can keep its placeholder
+            if (search_text and matching_exts) or cat_iid in self._user_open:
+                self.populate_category(cat_iid)
+            if cat_iid not in self._ext_iids:
+                continue
+            
+            child_position = 0
+            for ext_iid, (_, ext_lower) in zip(self._ext_iids[cat_iid], children):
+                if not matching_exts or search_text in ext_lower:
+                    self.tree.reattach(ext_iid, cat_iid, child_position)
+                    child_position += 1
+                    shown_exts.add(ext_iid)
+                    if search_text and matching_exts:
+                        matched_exts.add(ext_iid)
+                else:
+                    self.tree.detach(ext_iid)
+        
+        # Only retag extension rows whose highlight actually changes
+        for ext_iid in self._matched_exts - matched_exts:
+            self.tree.item(ext_iid, tags=())
+        for ext_iid in matched_exts - self._matched_exts:
+            self.tree.item(ext_iid, tags=("matched",))
+        self._matched_exts = matched_exts
+        self._last_search = (search_text, now_visible)
+        
+        # Reopen what the user had open, and auto-expand categories with
+        # matching items unless so many match that it would bury the results
+        self._auto_expanded = set()
+        if len(expand) <= 10:
+            self._auto_expanded.update(expand)
+        self._auto_expanded -= self._user_open
+        for cat_iid in now_visible:
+            if cat_iid in self._user_open or cat_iid in self._auto_expanded:
+                self.tree.item(cat_iid, open=True)
+        
+        # Keep focus and selection off hidden rows, so keyboard actions and
+        # Delete can't reach items the user can no longer see
+        shown = set(now_visible) | shown_exts
+        focus = self.tree.focus()
+        if focus in self._item_names and focus not in shown:
+            self.tree.focus("")
+        hidden = [item for item in self.tree.selection()
+                  if item in self._item_names and item not in shown]
+        if hidden:
+            self.tree.selection_remove(*hidden)
+
     def set_status(self, message, duration=3000):
         """Set status message with auto-clear."""
         self.status_label.config(text=message)
-        self.after(duration, lambda: self.status_label.config(text="Ready"))
+        # Only the newest message's timer should reset the label
+        if self._status_after_id is not None:
+            self.after_cancel(self._status_after_id)
+        self._status_after_id = self.after(duration, self.reset_status)
+
+    def reset_status(self):
+        self._status_after_id = None
+        self.status_label.config(text="Ready")
 
     def on_tree_double_click(self, event):
         """Handle double-click on tree items."""
@@ -581,6 +823,7 @@ class CategoryEditor(tk.Toplevel):
                 if self.tree.item(item, "open"):
                     self.tree.item(item, open=False)
                 else:
+                    self.populate_category(item)
                     self.tree.item(item, open=True)
 
     def on_tree_right_click(self, event):
@@ -608,15 +851,12 @@ class CategoryEditor(tk.Toplevel):
             context_menu.add_command(label="🗑️ Delete Extension",
                                    command=self.delete_selected)
             context_menu.add_separator()
-            category_text = self.tree.item(parent, "text")
-            category = category_text.replace("📁 ", "")
-            ext_text = self.tree.item(item, "text")
-            ext = ext_text.replace("🏷️ .", "")
+            category = self._item_names[parent]
+            ext = self._item_names[item]
             context_menu.add_command(label=f"📋 Copy '.{ext}'",
                                    command=lambda: self.copy_to_clipboard(f".{ext}"))
         else:  # It's a category
-            category_text = self.tree.item(item, "text")
-            category = category_text.replace("📁 ", "")
+            category = self._item_names[item]
             
             context_menu.add_command(label="📁 Expand/Collapse",
                                    command=lambda: self.toggle_category(item))
@@ -652,6 +892,7 @@ class CategoryEditor(tk.Toplevel):
         if self.tree.item(item, "open"):
             self.tree.item(item, open=False)
         else:
+            self.populate_category(item)
             self.tree.item(item, open=True)
             
     def copy_to_clipboard(self, text):
@@ -676,6 +917,7 @@ class CategoryEditor(tk.Toplevel):
             return
         
         self.categories[name] = []
+        self._dirty = True
         self.refresh_tree()
         self.set_status(f"Added category: {name}")
 
@@ -689,27 +931,36 @@ class CategoryEditor(tk.Toplevel):
         
         # Get the category (if extension is selected, get its parent)
         parent = self.tree.parent(item) or item
-        category_text = self.tree.item(parent, "text")
-        category = category_text.replace("📁 ", "")  # Remove icon
+        category = self._item_names[parent]
         
+        # Several extensions can be entered at once, so adding a batch
+        # costs one dialog and one tree refresh
         dialog = ModernDialog(self, "Add Extension", 
-                            f"Enter extension for '{category}':", 
-                            validate_extension)
+                            f"Enter extension(s) for '{category}':", 
+                            validate_extension_list)
         self.wait_window(dialog)
         
         if not dialog.result:
             return
             
-        ext = dialog.result
-        if ext in self.categories[category]:
-            messagebox.showerror("Duplicate Extension", 
-                               f"Extension '.{ext}' already exists in '{category}'.", 
-                               parent=self)
+        exts = dialog.result
+        existing = self.categories[category]
+        new_exts = [ext for ext in exts if ext not in existing]
+        if not new_exts:
+            if len(exts) == 1:
+                message = f"Extension '.{exts[0]}' already exists in '{category}'."
+            else:
+                message = f"All of those extensions already exist in '{category}'."
+            messagebox.showerror("Duplicate Extension", message, parent=self)
             return
         
-        self.categories[category].append(ext)
+        existing.extend(new_exts)
+        self._dirty = True
         self.refresh_tree()
-        self.set_status(f"Added .{ext} to {category}")
+        if len(new_exts) == 1:
+            self.set_status(f"Added .{new_exts[0]} to {category}")
+        else:
+            self.set_status(f"Added {len(new_exts)} extensions to {category}")
 
     def edit_selected(self):
         """Edit the selected item."""
@@ -735,22 +986,20 @@ class CategoryEditor(tk.Toplevel):
         parent = self.tree.parent(item)
         
         if parent:  # Deleting an extension
-            category_text = self.tree.item(parent, "text")
-            category = category_text.replace("📁 ", "")
-            
-            ext_text = self.tree.item(item, "text")
-            ext = ext_text.replace("🏷️ .", "")
+            category = self._item_names[parent]
+            ext = self._item_names[item]
             
             if messagebox.askyesno("Confirm Delete", 
                                  f"Delete extension '.{ext}' from '{category}'?", 
                                  parent=self):
-                if ext in self.categories[category]:
-                    self.categories[category].remove(ext)
+                exts = self.categories[category]
+                if ext in exts:
+                    exts.remove(ext)
+                    self._dirty = True
                     self.refresh_tree()
                     self.set_status(f"Deleted .{ext} from {category}")
         else:  # Deleting a category
-            category_text = self.tree.item(item, "text")
-            category = category_text.replace("📁 ", "")
+            category = self._item_names[item]
             
             if category == "Other":
                 messagebox.showerror("Cannot Delete", 
@@ -763,87 +1012,104 @@ class CategoryEditor(tk.Toplevel):
                                  parent=self):
                 if category in self.categories:
                     del self.categories[category]
+                    self._dirty = True
                     self.refresh_tree()
                     self.set_status(f"Deleted category: {category}")
 
     def save_close(self):
         """Save categories and close the editor."""
+        if not self._dirty:
+            self.destroy()
+            return
+        if self._saving:
+            return
+        self._saving = True
+        self.set_status("Saving...")
+        
+        # Write on a worker thread so a slow disk can't freeze the window;
+        # it gets its own copy in case the lists change meanwhile
+        snapshot = {cat: list(exts) for cat, exts in self.categories.items()}
+        threading.Thread(target=self._save_worker, args=(snapshot,), daemon=True).start()
+
+    def _save_worker(self, categories):
+        try:
+            save_user_categories(categories)
+        except Exception as e:
+            error = e
+        else:
+            error = None
         try:
-            save_user_categories(self.categories)
+            self.after(0, self._save_finished, error)
+        except (RuntimeError, tk.TclError):
+            # The main window was closed while we were saving
+            pass
+
+    def _save_finished(self, error):
+        self._saving = False
+        if not self.winfo_exists():
+            return
+        if error is None:
             messagebox.showinfo("Success", 
                               "Categories saved successfully!", parent=self)
             self.destroy()
-        except Exception as e:
+        else:
             messagebox.showerror("Save Failed",
-                               f"Could not save categories: {str(e)}", parent=self)
+                               f"Could not save categories: {str(error)}", parent=self)
                                
     # ---- Tooltip functionality ----
     def create_tooltip(self, widget, text):
         """Create a tooltip for a widget."""
-        def enter(event):
-            self.tooltip = tk.Toplevel(self)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{event.x_root+15}+{event.y_root+10}")
+        # Every widget in the editor passes its events through the editor's
+        # own bindings, so registering the text is all that's needed
+        self._tooltips[str(widget)] = text
+
+    def show_tooltip(self, event):
+        text = self._tooltips.get(str(event.widget))
+        if text is None:
+            return
+        
+        if self._tooltip_win is None:
+            self._tooltip_win = tk.Toplevel(self)
+            self._tooltip_win.wm_overrideredirect(True)
             
-            frame = ttk.Frame(self.tooltip, borderwidth=1, relief="solid")
+            frame = ttk.Frame(self._tooltip_win, borderwidth=1, relief="solid")
             frame.pack(fill="both", expand=True)
             
-            label = ttk.Label(frame, text=text, justify="left",
-                            background="#f8f9fa",
-                            foreground="#000000",
-                            font=("Segoe UI", 9),
-                            wraplength=250,
-                            padding=(5, 3))
-            label.pack()
-            
-        def leave(event):
-            if hasattr(self, 'tooltip'):
-                self.tooltip.destroy()
-                
-        widget.bind("<Enter>", enter)
-        widget.bind("<Leave>", leave)
+            self._tooltip_label = ttk.Label(frame, justify="left",
+                                          background="#f8f9fa",
+                                          foreground="#000000",
+                                          font=("Segoe UI", 9),
+                                          wraplength=250,
+                                          padding=(5, 3))
+            self._tooltip_label.pack()
+        
+        self._tooltip_label.config(text=text)
+        self._tooltip_win.wm_geometry(f"+{event.x_root+15}+{event.y_root+10}")
+        self._tooltip_win.deiconify()
+
+    def hide_tooltip(self, event):
+        if self._tooltip_win is not None and str(event.widget) in self._tooltips:
+            self._tooltip_win.withdraw()
         
     # ---- Search functionality ----
     def on_search_change(self, *args):
         """Handle search text changes."""
+        # Keys that don't edit the text (arrows, Shift, ...) change nothing
+        if self.search_var.get().lower() == self._applied_search:
+            return
+        # Wait for a pause in typing so a burst of keystrokes filters once
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(150, self.apply_search)
+
+    def apply_search(self):
+        """Filter the tree by the current search text."""
+        self._search_after_id = None
         search_text = self.search_var.get().lower()
+        self._applied_search = search_text
+        self.filter_tree(search_text)
         if not search_text:
-            # If search is cleared, just refresh the tree
-            self.refresh_tree()
             return
-            
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
-            
-        # Search in categories and extensions
-        for cat, exts in sorted(self.categories.items()):
-            cat_matches = search_text in cat.lower()
-            matching_exts = [ext for ext in exts if search_text in ext.lower()]
-            
-            if cat_matches or matching_exts:
-                # Format extensions list
-                if matching_exts:
-                    ext_display = ", ".join(f".{ext}" for ext in sorted(matching_exts))
-                else:
-                    ext_display = ", ".join(f".{ext}" for ext in sorted(exts))
-                    
-                if len(ext_display) > 50:
-                    ext_display = ext_display[:47] + "..."
-                
-                # Insert category
-                parent = self.tree.insert("", "end", text=f"📁 {cat}",
-                                        values=(len(matching_exts) if matching_exts else len(exts),
-                                               ext_display))
-                
-                # Add matching extensions as children
-                for ext in sorted(matching_exts if matching_exts else exts):
-                    if not matching_exts or search_text in ext.lower():
-                        self.tree.insert(parent, "end", text=f"🏷️ .{ext}", values=("", ""))
-                
-                # Auto-expand categories with matching items
-                if matching_exts and not cat_matches:
-                    self.tree.item(parent, open=True)
         
         # Update status
         if self.tree.get_children():
@@ -853,7 +1119,10 @@ class CategoryEditor(tk.Toplevel):
             
     def clear_search(self):
         """Clear the search field."""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
         self.search_var.set("")
+        self.apply_search()
         self.search_entry.focus_set()
         
     # ---- Help section ----
@@ -888,42 +1157,7 @@ class CategoryEditor(tk.Toplevel):
         help_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=help_text.yview)
         
-        # Help content
-        help_content = """
-🗂️ Category Manager
-
-The Category Manager allows you to organize file extensions into categories for automatic file sorting.
-
-📌 Basic Operations:
-• Create new categories to group related file types
-• Add extensions to categories
-• Delete extensions or categories
-• Search for categories or extensions
-
-📌 Keyboard Shortcuts:
-• Ctrl+N: Create a new category
-• Ctrl+E: Add an extension to selected category
-• Ctrl+F: Search for categories or extensions
-• F1: Show this help
-• Delete: Delete selected item
-
-📌 Tips:
-• Right-click on categories or extensions for additional options
-• Double-click on a category to expand or collapse it
-• Use the search bar to quickly find categories or extensions
-• The "Other" category cannot be deleted as it's used for uncategorized files
-• Changes are only saved when you click "Save & Close"
-
-📌 Categories:
-Categories help organize your files by type. Each category can contain multiple file extensions.
-Built-in categories include: Images, Videos, Audio, Docs, Executable, Archives, Code, Fonts, Ebooks, Sheets, and Other.
-
-📌 Extensions:
-Extensions are file types (without the dot). For example: "pdf", "jpg", "mp3".
-Each extension can only belong to one category.
-        """
-        
-        help_text.insert("1.0", help_content)
+        help_text.insert("1.0", HELP_CONTENT)
         help_text.config(state="disabled")  # Make read-only
         
         # Close button
@@ -932,8 +1166,24 @@ Each extension can only belong to one category.
     
     def bind_mousewheel(self):
         """Bind mouse wheel scrolling to the canvas"""
+        # Wheel events are summed and applied once per idle pass, so a
+        # fast-firing wheel scrolls the canvas once rather than per event
+        self._wheel_delta = 0
+        self._wheel_after_id = None
+        
+        def _flush_wheel():
+            self._wheel_after_id = None
+            # 120 is one notch; keep any partial notch for the next flush so
+            # high-resolution wheels that send small deltas still scroll
+            units = int(-self._wheel_delta / 120)
+            self._wheel_delta += units * 120
+            if units:
+                self.main_canvas.yview_scroll(units, "units")
+        
         def _on_mousewheel(event):
-            self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
+            self._wheel_delta += event.delta
+            if self._wheel_after_id is None:
+                self._wheel_after_id = self.after_idle(_flush_wheel)
         
         def _bind_to_mousewheel(event):
             self.main_canvas.bind_all("<MouseWheel>", _on_mousewheel)
@@ -1,9 +1,12 @@
 import sys
+# Pick the implementation once at import, so a missing plyer costs nothing per call
 try:
     from plyer import notification as plyer_notify
+
+    def notify(title: str, msg: str):
+        plyer_notify.notify(title=title, message=msg, timeout=3)
 except ImportError:
     plyer_notify = None
 
-def notify(title: str, msg: str):
-    if plyer_notify:
-        plyer_notify.notify(title=title, message=msg, timeout=3)
\ No newline at end of file
+    def notify(title: str, msg: str):
+        pass
\ No newline at end of file